@@ -4,6 +4,7 @@
 # dependencies = [
 #     "requests>=2.32.4",
 #     "colorama>=0.4.6",
+#     "orjson>=3.9",
 # ]
 # ///
 
@@ -14,14 +15,13 @@ A command-line tool to create Jira tickets from GitLab merge requests.
 """
 
 import argparse
-import json
+import functools
 import os
 import re
 import sys
-from typing import Dict, Optional, List
-import requests
-from urllib.parse import urljoin
-from colorama import init, Fore, Style
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
+from urllib.parse import quote
 
 # TypeGuard compatibility for older Python versions
 try:
@@ -31,8 +31,47 @@ except ImportError:
     def TypeGuard(x):
         return bool
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+# requests is imported lazily by _load_requests() since --help and --setup never need it
+if TYPE_CHECKING:
+    import requests
+
+# Prefer orjson for JSON encoding/decoding, fall back to the standard library
+try:
+    import orjson
+
+    def _loads(data):
+        """Deserialize JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    import json
+
+    def _loads(data):
+        """Deserialize JSON from str or bytes."""
+        return json.loads(data)
+
+    def _dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# Colors are only used on a terminal. Piped output (CI logs, files) was stripped
+# of escape codes by colorama anyway, so skip importing and initializing it there.
+if sys.stdout.isatty():
+    from colorama import init, Fore, Style
+
+    # Initialize colorama for cross-platform color support
+    init(autoreset=True)
+else:
+    class _NoColor:
+        """Stand-in for colorama's Fore and Style that yields empty codes."""
+
+        def __getattr__(self, name: str) -> str:
+            return ""
+
+    Fore = Style = _NoColor()
 
 
 class Colors:
@@ -54,25 +93,33 @@ class Colors:
     URL = Fore.BLUE + Style.BRIGHT
     COMMAND = Fore.WHITE + Style.BRIGHT
 
+    # Precomputed message prefixes
+    _SUCCESS_PREFIX = f"{SUCCESS}✅ "
+    _ERROR_PREFIX = f"{ERROR}❌ "
+    _WARNING_PREFIX = f"{WARNING}⚠️  "
+    _INFO_PREFIX = f"{INFO}ℹ️  "
+    _URL_PREFIX = f"{URL}🔗 "
+    _DIVIDER = "─" * 60
+
     @staticmethod
     def success(text: str) -> str:
         """Format text as success message."""
-        return f"{Colors.SUCCESS}✅ {text}{Style.RESET_ALL}"
+        return f"{Colors._SUCCESS_PREFIX}{text}{Colors.RESET}"
 
     @staticmethod
     def error(text: str) -> str:
         """Format text as error message."""
-        return f"{Colors.ERROR}❌ {text}{Style.RESET_ALL}"
+        return f"{Colors._ERROR_PREFIX}{text}{Colors.RESET}"
 
     @staticmethod
     def warning(text: str) -> str:
         """Format text as warning message."""
-        return f"{Colors.WARNING}⚠️  {text}{Style.RESET_ALL}"
+        return f"{Colors._WARNING_PREFIX}{text}{Colors.RESET}"
 
     @staticmethod
     def info(text: str) -> str:
         """Format text as info message."""
-        return f"{Colors.INFO}ℹ️  {text}{Style.RESET_ALL}"
+        return f"{Colors._INFO_PREFIX}{text}{Colors.RESET}"
 
     @staticmethod
     def header(text: str) -> str:
@@ -82,7 +129,7 @@ class Colors:
     @staticmethod
     def url(text: str) -> str:
         """Format text as URL."""
-        return f"{Colors.URL}🔗 {text}{Style.RESET_ALL}"
+        return f"{Colors._URL_PREFIX}{text}{Colors.RESET}"
 
     @staticmethod
     def command(text: str) -> str:
@@ -97,8 +144,8 @@ class Colors:
     @staticmethod
     def section_divider(title: str) -> str:
         """Create a section divider with title."""
-        divider = "─" * 60
-        return f"{Colors.HEADER}{divider}\n{title}\n{divider}{Style.RESET_ALL}"
+        divider = Colors._DIVIDER
+        return f"{Colors.HEADER}{divider}\n{title}\n{divider}{Colors.RESET}"
 
 
 def confirm_creation() -> bool:
@@ -120,12 +167,91 @@ def confirm_creation() -> bool:
             return False
 
 
+# Read-only stand-in for a missing config section, so lookups don't allocate a new {}
+_EMPTY = MappingProxyType({})
+
+# (section, field) pairs that must be configured before creating tickets
+_REQUIRED_CONFIG = (
+    ('gitlab', 'url'),
+    ('gitlab', 'token'),
+    ('jira', 'url'),
+    ('jira', 'username'),
+    ('jira', 'api_token'),
+)
+
+
+# Config values that can be overridden by environment variables: section -> key -> variable.
+# AUTO_ASSIGN_ME is handled separately since it is parsed as a boolean.
+_ENV_CONFIG = {
+    'gitlab': {
+        'url': 'GITLAB_URL',
+        'token': 'GITLAB_TOKEN'
+    },
+    'jira': {
+        'url': 'JIRA_URL',
+        'username': 'JIRA_USERNAME',
+        'api_token': 'JIRA_API_TOKEN',
+        'project_key': 'JIRA_PROJECT_KEY'
+    },
+    'defaults': {
+        'issue_type': 'JIRA_ISSUE_TYPE',
+        'priority': 'JIRA_PRIORITY'
+    }
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime: float) -> Dict:
+    """Parse a config file; cached per modification time so an unchanged file is parsed once."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _ask(prompt: str, default: str = "") -> str:
+    """Prompt for a line on stdin; works with piped input and returns default on empty input or EOF."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.strip() or default
+
+
+# Fixed prompts of the interactive setup, colored once at import
+_SETUP_PROMPTS = {key: f"{Colors.INFO}{text}: {Colors.RESET}" for key, text in (
+    ('gitlab_url', "GitLab URL (e.g., https://gitlab.com)"),
+    ('gitlab_token', "GitLab Personal Access Token"),
+    ('jira_url', "Jira URL (e.g., https://yourcompany.atlassian.net)"),
+    ('jira_username', "Jira Username/Email"),
+    ('jira_token', "Jira API Token"),
+    ('jira_project', "Default Jira Project Key"),
+    ('issue_type', "Default Issue Type (default: Task)"),
+    ('labels', "Default Labels (comma-separated, optional)"),
+    ('components', "Default Components (comma-separated, optional)"),
+    ('priority', "Default Priority (optional)"),
+    ('auto_assign_me', "Auto-assign tickets to yourself? (y/n, default: n)"),
+    ('add_mapping', "\nAdd a project mapping? (y/n)"),
+    ('gitlab_project', "GitLab project path (e.g., 'namespace/project')"),
+)}
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    return [item for item in (part.strip() for part in value.split(',')) if item] if value else []
+
+
 class Config:
     """Configuration manager for API credentials and settings."""
 
+    __slots__ = ('config_file', 'config', '_project_key_cache', '_defaults_cache')
+
     def __init__(self, config_file: str = "~/.gitlab-jira-cli.json"):
         self.config_file = os.path.expanduser(config_file)
         self.config = self.load_config()
+        self.clear_caches()
+
+    def clear_caches(self):
+        """Forget memoized lookups; call after replacing self.config."""
+        self._project_key_cache: Dict[str, str] = {}
+        self._defaults_cache: Optional[Dict] = None
 
     def load_config(self) -> Dict:
         """Load configuration from file or environment variables."""
@@ -134,37 +260,21 @@ class Config:
         # Try to load from config file
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                file_config = _read_config_file(self.config_file, os.path.getmtime(self.config_file))
+                # Copy the cached sections since they are updated in place below
+                config = {key: dict(value) if isinstance(value, dict) else value
+                          for key, value in file_config.items()}
+            except (ValueError, IOError) as e:
                 print(Colors.warning(f"Could not load config file: {e}"))
 
         # Override with environment variables if present
-        env_config = {
-            'gitlab': {
-                'url': os.getenv('GITLAB_URL'),
-                'token': os.getenv('GITLAB_TOKEN')
-            },
-            'jira': {
-                'url': os.getenv('JIRA_URL'),
-                'username': os.getenv('JIRA_USERNAME'),
-                'api_token': os.getenv('JIRA_API_TOKEN'),
-                'project_key': os.getenv('JIRA_PROJECT_KEY')
-            },
-            'defaults': {
-                'issue_type': os.getenv('JIRA_ISSUE_TYPE'),
-                'priority': os.getenv('JIRA_PRIORITY'),
-                'auto_assign_me': os.getenv('AUTO_ASSIGN_ME', '').lower() in ['true', '1', 'yes', 'on'] if os.getenv('AUTO_ASSIGN_ME') else None
-            }
-        }
+        for section, variables in _ENV_CONFIG.items():
+            overrides = {key: os.environ[var] for key, var in variables.items() if var in os.environ}
+            config.setdefault(section, {}).update(overrides)
 
-        # Merge configurations
-        for section, values in env_config.items():
-            if section not in config:
-                config[section] = {}
-            for key, value in values.items():
-                if value is not None:
-                    config[section][key] = value
+        auto_assign_me = os.environ.get('AUTO_ASSIGN_ME')
+        if auto_assign_me:
+            config['defaults']['auto_assign_me'] = auto_assign_me.lower() in ['true', '1', 'yes', 'on']
 
         return config
 
@@ -172,35 +282,65 @@ class Config:
         """Save current configuration to file."""
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps(self.config, indent=True))
             print(Colors.success(f"Configuration saved to {self.config_file}"))
         except IOError as e:
             print(Colors.error(f"Error saving configuration: {e}"))
 
+    def setup_from_env(self) -> bool:
+        """Save the loaded configuration, with environment overrides applied, without prompting.
+
+        Values from the existing config file are kept unless an environment
+        variable overrides them. Returns False, saving nothing, unless every
+        required setting is available.
+        """
+        missing = [f"{section}.{field}" for section, field in _REQUIRED_CONFIG
+                   if not self.config.get(section, {}).get(field)]
+        if missing:
+            print(Colors.error(f"Missing configuration for {', '.join(missing)}"))
+            print(Colors.info("Set the corresponding environment variables and try again"))
+            return False
+
+        # load_config has already merged the file with the environment; only
+        # fill in what a fresh interactive setup would have written
+        self.config['jira'].setdefault('project_key', '')
+        defaults = self.config['defaults']
+        defaults.setdefault('issue_type', 'Task')
+        defaults.setdefault('labels', [])
+        defaults.setdefault('components', [])
+        defaults.setdefault('priority', None)
+        defaults.setdefault('auto_assign_me', False)
+        self.config.setdefault('project_mappings', {})
+        self.clear_caches()
+
+        print(Colors.info("Using configuration from environment variables"))
+        self.save_config()
+        return True
+
     def setup_interactive(self):
         """Interactive setup for configuration."""
         print(Colors.header("Setting up GitLab to Jira CLI configuration..."))
 
         # GitLab configuration
         print(Colors.section_divider("GitLab Configuration"))
-        gitlab_url = input(f"{Colors.INFO}GitLab URL (e.g., https://gitlab.com): {Style.RESET_ALL}").strip()
-        gitlab_token = input(f"{Colors.INFO}GitLab Personal Access Token: {Style.RESET_ALL}").strip()
+        gitlab_url = _ask(_SETUP_PROMPTS['gitlab_url'])
+        gitlab_token = _ask(_SETUP_PROMPTS['gitlab_token'])
 
         # Jira configuration
         print(Colors.section_divider("Jira Configuration"))
-        jira_url = input(f"{Colors.INFO}Jira URL (e.g., https://yourcompany.atlassian.net): {Style.RESET_ALL}").strip()
-        jira_username = input(f"{Colors.INFO}Jira Username/Email: {Style.RESET_ALL}").strip()
-        jira_token = input(f"{Colors.INFO}Jira API Token: {Style.RESET_ALL}").strip()
-        jira_project = input(f"{Colors.INFO}Default Jira Project Key: {Style.RESET_ALL}").strip()
+        jira_url = _ask(_SETUP_PROMPTS['jira_url'])
+        jira_username = _ask(_SETUP_PROMPTS['jira_username'])
+        jira_token = _ask(_SETUP_PROMPTS['jira_token'])
+        jira_project = _ask(_SETUP_PROMPTS['jira_project'])
 
         # Default settings
         print(Colors.section_divider("Default Settings"))
-        default_issue_type = input(f"{Colors.INFO}Default Issue Type (default: Task): {Style.RESET_ALL}").strip() or "Task"
-        default_labels = input(f"{Colors.INFO}Default Labels (comma-separated, optional): {Style.RESET_ALL}").strip()
-        default_components = input(f"{Colors.INFO}Default Components (comma-separated, optional): {Style.RESET_ALL}").strip()
-        default_priority = input(f"{Colors.INFO}Default Priority (optional): {Style.RESET_ALL}").strip()
-        auto_assign_me = input(f"{Colors.INFO}Auto-assign tickets to yourself? (y/n, default: n): {Style.RESET_ALL}").strip().lower() in ['y', 'yes']
+        default_issue_type = _ask(_SETUP_PROMPTS['issue_type'], default="Task")
+        default_labels = _ask(_SETUP_PROMPTS['labels'])
+        default_components = _ask(_SETUP_PROMPTS['components'])
+        default_priority = _ask(_SETUP_PROMPTS['priority'])
+        auto_assign_me = _ask(_SETUP_PROMPTS['auto_assign_me']).lower() in ['y', 'yes']
 
         self.config = {
             'gitlab': {
@@ -215,13 +355,14 @@ class Config:
             },
             'defaults': {
                 'issue_type': default_issue_type,
-                'labels': [l.strip() for l in default_labels.split(',') if l.strip()] if default_labels else [],
-                'components': [c.strip() for c in default_components.split(',') if c.strip()] if default_components else [],
+                'labels': _split_csv(default_labels),
+                'components': _split_csv(default_components),
                 'priority': default_priority if default_priority else None,
                 'auto_assign_me': auto_assign_me
             },
             'project_mappings': {}
         }
+        self.clear_caches()
 
         # Ask about project mappings
         print(Colors.section_divider("Project Mappings (Optional)"))
@@ -229,12 +370,12 @@ class Config:
         print(Colors.info("This allows different GitLab projects to create tickets in different Jira projects."))
 
         while True:
-            add_mapping = input(f"\n{Colors.INFO}Add a project mapping? (y/n): {Style.RESET_ALL}").strip().lower()
+            add_mapping = _ask(_SETUP_PROMPTS['add_mapping']).lower()
             if add_mapping != 'y':
                 break
 
-            gitlab_project = input(f"{Colors.INFO}GitLab project path (e.g., 'namespace/project'): {Style.RESET_ALL}").strip()
-            jira_project_key = input(f"{Colors.INFO}Jira project key for '{gitlab_project}': {Style.RESET_ALL}").strip()
+            gitlab_project = _ask(_SETUP_PROMPTS['gitlab_project'])
+            jira_project_key = _ask(f"{Colors.INFO}Jira project key for '{gitlab_project}': {Style.RESET_ALL}")
 
             if gitlab_project and jira_project_key:
                 self.config['project_mappings'][gitlab_project] = {
@@ -246,45 +387,107 @@ class Config:
 
     def get_jira_project_for_gitlab_project(self, gitlab_project_path: str) -> str:
         """Get the appropriate Jira project key for a GitLab project."""
-        # Check project mappings first
-        if 'project_mappings' in self.config and gitlab_project_path in self.config['project_mappings']:
-            return self.config['project_mappings'][gitlab_project_path]['jira_project_key']
+        if gitlab_project_path in self._project_key_cache:
+            return self._project_key_cache[gitlab_project_path]
 
-        # Fall back to default
-        return self.config.get('jira', {}).get('project_key', '')
+        # Check project mappings first, fall back to default
+        mapping = (self.config.get('project_mappings') or _EMPTY).get(gitlab_project_path)
+        if mapping is not None:
+            project_key = mapping['jira_project_key']
+        else:
+            project_key = (self.config.get('jira') or _EMPTY).get('project_key', '')
+
+        self._project_key_cache[gitlab_project_path] = project_key
+        return project_key
 
     def get_default_settings(self) -> Dict:
         """Get default settings from config."""
-        return self.config.get('defaults', {
-            'issue_type': 'Task',
-            'labels': [],
-            'components': [],
-            'priority': None,
-            'auto_assign_me': False
-        })
+        if self._defaults_cache is None:
+            self._defaults_cache = self.config.get('defaults', {
+                'issue_type': 'Task',
+                'labels': [],
+                'components': [],
+                'priority': None,
+                'auto_assign_me': False
+            })
+        return self._defaults_cache
+
+
+# Validators and bodies of GET responses, keyed by URL, kept between runs
+_ETAG_CACHE_FILE = "~/.gitlab-jira-cli.cache.json"
+_ETAG_CACHE_LIMIT = 200
+
+
+def load_etag_cache(cache_file: str = _ETAG_CACHE_FILE) -> Dict[str, List]:
+    """Load the ETag cache from disk, starting empty if it is missing or unreadable."""
+    try:
+        with open(os.path.expanduser(cache_file), 'rb') as f:
+            cache = _loads(f.read())
+    except (IOError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_etag_cache(cache: Dict[str, List], cache_file: str = _ETAG_CACHE_FILE):
+    """Write the ETag cache to disk, keeping only the most recently stored entries."""
+    entries = list(cache.items())[-_ETAG_CACHE_LIMIT:]
+    cache_file = os.path.expanduser(cache_file)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            f.write(_dumps(dict(entries)))
+    except IOError:
+        # The cache only saves bandwidth; failing to write it is not an error
+        pass
+
+
+def _load_requests():
+    """Import requests on first use and bind it as a module global."""
+    global requests
+    import requests
+    return requests
+
+
+def create_session() -> 'requests.Session':
+    """Create an HTTP session with connection pooling and retries for idempotent requests."""
+    _load_requests()
+    from requests.adapters import HTTPAdapter, Retry
+
+    session = requests.Session()
+    # POST is deliberately not retried so a flaky response can't create duplicate tickets
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'PUT']), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class GitLabAPI:
     """GitLab API client."""
 
-    def __init__(self, url: str, token: str):
+    __slots__ = ('url', 'token', 'session', 'etag_cache')
+
+    def __init__(self, url: str, token: str, etag_cache: Optional[Dict[str, List]] = None):
         self.url = url.rstrip('/')
         self.token = token
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         })
+        # [etag, body] per URL; unchanged resources come back as an empty 304
+        self.etag_cache = {} if etag_cache is None else etag_cache
 
     def get_merge_request(self, project_id: str, mr_iid: str) -> Optional[Dict]:
         """Get merge request details."""
         endpoint = f"/api/v4/projects/{project_id}/merge_requests/{mr_iid}"
-        url = urljoin(self.url, endpoint)
+        url = f"{self.url}{endpoint}"
 
         try:
-            response = self.session.get(url)
-            if is_valid_response(response):
-                return response.json()
+            response, mr_data = conditional_get(self.session, url, self.etag_cache)
+            if mr_data is not None:
+                return mr_data
             else:
                 print(Colors.error(f"Error fetching GitLab MR: Invalid response (status: {response.status_code})"))
                 return None
@@ -295,12 +498,12 @@ class GitLabAPI:
     def get_project_details(self, project_id: str) -> Optional[Dict]:
         """Get project details including numeric project ID."""
         endpoint = f"/api/v4/projects/{project_id}"
-        url = urljoin(self.url, endpoint)
+        url = f"{self.url}{endpoint}"
 
         try:
             response = self.session.get(url)
             if is_valid_response(response):
-                return response.json()
+                return parse_json_response(response)
             else:
                 print(Colors.error(f"Error fetching GitLab project details: Invalid response (status: {response.status_code})"))
                 return None
@@ -311,12 +514,12 @@ class GitLabAPI:
     def update_merge_request_title(self, project_id: str, mr_iid: str, new_title: str) -> bool:
         """Update merge request title."""
         endpoint = f"/api/v4/projects/{project_id}/merge_requests/{mr_iid}"
-        url = urljoin(self.url, endpoint)
+        url = f"{self.url}{endpoint}"
 
         payload = {"title": new_title}
 
         try:
-            response = self.session.put(url, json=payload)
+            response = self.session.put(url, data=_dumps(payload))
             if is_valid_response(response):
                 return True
             else:
@@ -330,21 +533,76 @@ class GitLabAPI:
                 print(f"Response: {e.response.text}")
             return False
 
-def is_valid_response(response: Optional[requests.Response]) -> TypeGuard[requests.Response]:
+def is_valid_response(response: 'Optional[requests.Response]') -> 'TypeGuard[requests.Response]':
     """Check if the response is valid (status code 200-299) and not empty."""
-    return response is not None and response.status_code >= 200 and response.status_code < 300 and response.text.strip() != ""
+    # Check the raw bytes; response.text would decode the whole body just for this test
+    return (response is not None and 200 <= response.status_code < 300
+            and bool(response.content) and not response.content.isspace())
+
+def conditional_get(session: 'requests.Session', url: str, etag_cache: Dict[str, List]) -> Tuple['requests.Response', Optional[object]]:
+    """GET a JSON resource, revalidating any cached copy with If-None-Match.
+
+    Returns the response and the decoded body, which comes from the cache on a
+    304 and is None if the response was not valid.
+    """
+    cached = etag_cache.get(url)
+    headers = {'If-None-Match': cached[0]} if cached else None
+    response = session.get(url, headers=headers)
+    if cached and response.status_code == 304:
+        etag, data = cached
+    elif is_valid_response(response):
+        etag, data = response.headers.get('ETag'), parse_json_response(response)
+    else:
+        return response, None
+
+    if etag:
+        # Re-insert on every hit or refresh so the most recently used entries
+        # survive trimming on save
+        etag_cache.pop(url, None)
+        etag_cache[url] = [etag, data]
+    return response, data
+
+def parse_json_response(response: 'requests.Response'):
+    """Decode a JSON response body straight from the raw bytes.
+
+    Decoding errors are raised as requests.RequestException, like response.json() does.
+    """
+    try:
+        return _loads(response.content)
+    except ValueError as e:
+        raise requests.RequestException(f"Invalid JSON in response: {e}", response=response)
 
 class JiraAPI:
     """Jira API client."""
 
-    def __init__(self, url: str, username: str, api_token: str):
+    __slots__ = ('url', 'session', 'etag_cache', '_components_cache', '_component_names_cache',
+                 '_issue_fields_cache', '_transitions_cache')
+
+    def __init__(self, url: str, username: str, api_token: str, etag_cache: Optional[Dict[str, List]] = None):
         self.url = url.rstrip('/')
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.auth = (username, api_token)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        # [etag, body] per URL, shared with the GitLab client when persisted
+        self.etag_cache = {} if etag_cache is None else etag_cache
+        # Components fetched per project key, kept for the lifetime of the client
+        self._components_cache: Dict[str, List[Dict]] = {}
+        # Case-folded component name -> name as spelled in Jira, per project key
+        self._component_names_cache: Dict[str, Dict[str, str]] = {}
+        # Project and issue type fields per (project key, issue type); payloads only read them
+        self._issue_fields_cache: Dict[Tuple[str, str], Tuple[Dict, Dict]] = {}
+        # Transition IDs by lower-cased name, per project key
+        self._transitions_cache: Dict[str, Dict[str, str]] = {}
+
+    def _issue_fields(self, project_key: str, issue_type: str) -> Tuple[Dict, Dict]:
+        """Get the (cached) project and issue type fields for a new ticket."""
+        cache_key = (project_key, issue_type)
+        if cache_key not in self._issue_fields_cache:
+            self._issue_fields_cache[cache_key] = ({"key": project_key}, {"name": issue_type})
+        return self._issue_fields_cache[cache_key]
 
     def create_ticket(self, project_key: str, issue_type: str, summary: str,
                      description_content: Dict, labels: Optional[List[str]] = None,
@@ -352,14 +610,15 @@ class JiraAPI:
                      assignee: Optional[str] = None) -> Optional[Dict]:
         """Create a Jira ticket with structured content."""
         endpoint = "/rest/api/3/issue"
-        url = urljoin(self.url, endpoint)
+        url = f"{self.url}{endpoint}"
 
-        # Build the issue payload
+        # Build the issue payload; project and issue type are reused across a batch
+        project_field, issuetype_field = self._issue_fields(project_key, issue_type)
         fields = {
-            "project": {"key": project_key},
+            "project": project_field,
             "summary": summary,
             "description": description_content,
-            "issuetype": {"name": issue_type}
+            "issuetype": issuetype_field
         }
 
         # Add optional fields
@@ -378,9 +637,9 @@ class JiraAPI:
         payload = {"fields": fields}
 
         try:
-            response = self.session.post(url, json=payload)
+            response = self.session.post(url, data=_dumps(payload))
             if is_valid_response(response):
-                return response.json()
+                return parse_json_response(response)
             else:
                 print(Colors.error(f"Error creating Jira ticket: Invalid response (status: {response.status_code})"))
                 if response.text:
@@ -393,44 +652,51 @@ class JiraAPI:
             return None
 
     def transition_ticket(self, ticket_key: str, transition_name: str) -> bool:
-        """Transition a Jira ticket to a specific status."""
-        # First get available transitions
+        """Transition a Jira ticket to a specific status.
+
+        Transition IDs are cached per project, so later tickets in the same
+        project skip the lookup request.
+        """
         transitions_endpoint = f"/rest/api/3/issue/{ticket_key}/transitions"
-        transitions_url = urljoin(self.url, transitions_endpoint)
+        transitions_url = f"{self.url}{transitions_endpoint}"
+        project_key = ticket_key.split('-')[0]
+        name_key = transition_name.lower()
 
         try:
-            response = self.session.get(transitions_url)
-            if not is_valid_response(response):
-                print(Colors.error(f"Error fetching transitions: Invalid response (status: {response.status_code})"))
-                return False
+            transition_id = self._transitions_cache.get(project_key, {}).get(name_key)
 
-            transitions = response.json().get('transitions', [])
-
-            # Find the transition ID for "In Progress"
-            transition_id = None
-            for transition in transitions:
-                if transition['name'].lower() == transition_name.lower():
-                    transition_id = transition['id']
-                    break
+            if not transition_id:
+                # Get available transitions for this ticket
+                response = self.session.get(transitions_url)
+                if not is_valid_response(response):
+                    print(Colors.error(f"Error fetching transitions: Invalid response (status: {response.status_code})"))
+                    return False
+
+                transitions = parse_json_response(response).get('transitions', [])
+                # Reversed so the first transition wins if two share a name
+                self._transitions_cache[project_key] = {
+                    transition['name'].lower(): transition['id'] for transition in reversed(transitions)
+                }
+                transition_id = self._transitions_cache[project_key].get(name_key)
 
             if not transition_id:
                 print(Colors.warning(f"Could not find '{transition_name}' transition for ticket {ticket_key}"))
                 return False
 
-            # Execute the transition
-            transition_endpoint = f"/rest/api/3/issue/{ticket_key}/transitions"
-            transition_url = urljoin(self.url, transition_endpoint)
-
+            # Execute the transition on the same endpoint (and pooled connection)
             payload = {
                 "transition": {
                     "id": transition_id
                 }
             }
 
-            response = self.session.post(transition_url, json=payload)
-            if is_valid_response(response):
+            response = self.session.post(transitions_url, data=_dumps(payload))
+            # Jira answers a successful transition with 204 No Content
+            if 200 <= response.status_code < 300:
                 return True
             else:
+                # The cached ID may not apply to this ticket's workflow; look it up next time
+                self._transitions_cache.pop(project_key, None)
                 print(Colors.error(f"Error executing transition: Invalid response (status: {response.status_code})"))
                 if response.text:
                     print(f"Response: {response.text}")
@@ -443,14 +709,18 @@ class JiraAPI:
             return False
 
     def get_project_components(self, project_key: str) -> Optional[List[Dict]]:
-        """Get available components for a Jira project."""
+        """Get available components for a Jira project (cached per project key)."""
+        if project_key in self._components_cache:
+            return self._components_cache[project_key]
+
         endpoint = f"/rest/api/3/project/{project_key}/components"
-        url = urljoin(self.url, endpoint)
+        url = f"{self.url}{endpoint}"
 
         try:
-            response = self.session.get(url)
-            if is_valid_response(response):
-                return response.json()
+            response, components = conditional_get(self.session, url, self.etag_cache)
+            if components is not None:
+                self._components_cache[project_key] = components
+                return components
             else:
                 print(Colors.error(f"Error fetching Jira project components: Invalid response (status: {response.status_code})"))
                 if response.text:
@@ -458,10 +728,78 @@ class JiraAPI:
                 return None
         except requests.RequestException as e:
             print(Colors.error(f"Error fetching Jira project components: {e}"))
-            if is_valid_response(e.response):
+            if hasattr(e, 'response') and e.response is not None and hasattr(e.response, 'text'):
                 print(f"Response: {e.response.text}")
             return None
 
+    def get_component_names(self, project_key: str) -> Optional[Dict[str, str]]:
+        """Map case-folded component names to their Jira spelling (cached per project key)."""
+        names = self._component_names_cache.get(project_key)
+        if names is None:
+            components = self.get_project_components(project_key)
+            if not components:
+                return None
+            names = {comp['name'].casefold(): comp['name'] for comp in components}
+            self._component_names_cache[project_key] = names
+        return names
+
+
+# Markdown patterns used when converting GitLab descriptions to Jira
+# Inline elements in a single alternation; the group name is the Jira mark type
+_RE_INLINE = re.compile(
+    r'(?P<strong>\*\*(.*?)\*\*)'          # **bold**
+    r'|(?P<em>\*(.*?)\*)'                 # *italic*
+    r'|(?P<code>`(.*?)`)'                 # `code`
+    r'|(?P<link>\[(.*?)\]\((.*?)\))'      # [text](url)
+)
+# ![alt text](/uploads/hash/filename.ext){optional attributes}
+_RE_IMAGE = re.compile(r'!\[([^\]]*)\]\((/uploads/[^)]+)\)(\{[^}]*\})?')
+# https://gitlab.com/namespace/project/-/merge_requests/123, optionally followed by a
+# sub-page (/diffs), query string or fragment
+_RE_MR_URL = re.compile(r'^https?://[^/]+/(?P<path>.+?)/-/merge_requests/(?P<iid>\d+)(?:[/?#].*)?$')
+# Bracketed Jira key such as "[ABC-123] " at the start of an MR title; other
+# bracketed prefixes like "[WIP]" or "[frontend]" do not count
+_RE_TITLE_PREFIX = re.compile(r'^\[[A-Z][A-Z0-9_]+-\d+\]')
+
+
+# MR details shown in the ticket panel: (label, key path into the MR data, text mark)
+_MR_DETAIL_FIELDS = (
+    ("Author: ", ("author", "name"), "strong"),
+    ("Source Branch: ", ("source_branch",), "code"),
+    ("Target Branch: ", ("target_branch",), "code"),
+    ("State: ", ("state",), "strong"),
+    ("Created: ", ("created_at",), "strong"),
+)
+
+# Fixed document nodes shared between documents; documents are only ever serialized, never mutated
+_HARDBREAK = {"type": "hardBreak"}
+# Marks lists per inline mark type, shared by every marked text node
+_MARKS = {
+    "strong": [{"type": "strong"}],
+    "em": [{"type": "em"}],
+    "code": [{"type": "code"}],
+}
+_RULE = {"type": "rule"}
+_HEADER_PREFIX = {"type": "text", "text": "Created from "}
+_HEADER_SUFFIX = {"type": "text", "text": ":"}
+_MR_DETAILS_HEADING = {
+    "type": "heading",
+    "attrs": {"level": 3},
+    "content": [
+        {
+            "type": "text",
+            "text": "MR Details"
+        }
+    ]
+}
+
+
+def _dig(data: Dict, path: tuple):
+    """Follow a sequence of keys into nested dicts."""
+    for key in path:
+        data = data[key]
+    return data
+
 
 def create_jira_document(mr_url: str, mr_data: Dict, processed_description: Optional[str] = None) -> Dict:
     """Create a structured Jira document with proper formatting."""
@@ -475,10 +813,7 @@ def create_jira_document(mr_url: str, mr_data: Dict, processed_description: Opti
     content.append({
         "type": "paragraph",
         "content": [
-            {
-                "type": "text",
-                "text": "Created from "
-            },
+            _HEADER_PREFIX,
             {
                 "type": "text",
                 "text": "GitLab Merge Request",
@@ -491,15 +826,12 @@ def create_jira_document(mr_url: str, mr_data: Dict, processed_description: Opti
                     }
                 ]
             },
-            {
-                "type": "text",
-                "text": ":"
-            }
+            _HEADER_SUFFIX
         ]
     })
 
     # Add a divider
-    content.append({"type": "rule"})
+    content.append(_RULE)
 
     # Convert and add markdown content
     if original_description.strip() != "No description provided":
@@ -508,94 +840,22 @@ def create_jira_document(mr_url: str, mr_data: Dict, processed_description: Opti
 
         # Add another divider before MR details if we have content
         if markdown_content:
-            content.append({"type": "rule"})
+            content.append(_RULE)
 
     # MR Details panel
     mr_details_content = []
 
     # Panel heading
-    mr_details_content.append({
-        "type": "heading",
-        "attrs": {"level": 3},
-        "content": [
-            {
-                "type": "text",
-                "text": "MR Details"
-            }
-        ]
-    })
+    mr_details_content.append(_MR_DETAILS_HEADING)
 
-    # Panel content with MR details
+    # Panel content with MR details, one line per field
     detail_content = []
-
-    # Author
-    detail_content.extend([
-        {
-            "type": "text",
-            "text": "Author: "
-        },
-        {
-            "type": "text",
-            "text": mr_data['author']['name'],
-            "marks": [{"type": "strong"}]
-        },
-        {"type": "hardBreak"}
-    ])
-
-    # Source branch
-    detail_content.extend([
-        {
-            "type": "text",
-            "text": "Source Branch: "
-        },
-        {
-            "type": "text",
-            "text": mr_data['source_branch'],
-            "marks": [{"type": "code"}]
-        },
-        {"type": "hardBreak"}
-    ])
-
-    # Target branch
-    detail_content.extend([
-        {
-            "type": "text",
-            "text": "Target Branch: "
-        },
-        {
-            "type": "text",
-            "text": mr_data['target_branch'],
-            "marks": [{"type": "code"}]
-        },
-        {"type": "hardBreak"}
-    ])
-
-    # State
-    detail_content.extend([
-        {
-            "type": "text",
-            "text": "State: "
-        },
-        {
-            "type": "text",
-            "text": mr_data['state'],
-            "marks": [{"type": "strong"}]
-        },
-        {"type": "hardBreak"}
-    ])
-
-    # Created date
-    detail_content.extend([
-        {
-            "type": "text",
-            "text": "Created: "
-        },
-        {
-            "type": "text",
-            "text": mr_data['created_at'],
-            "marks": [{"type": "strong"}]
-        }
-    ])
+    last_field = len(_MR_DETAIL_FIELDS) - 1
+    for i, (label, path, mark) in enumerate(_MR_DETAIL_FIELDS):
+        detail_content.append({"type": "text", "text": label})
+        detail_content.append({"type": "text", "text": _dig(mr_data, path), "marks": _MARKS[mark]})
+        if i != last_field:
+            detail_content.append(_HARDBREAK)
 
     mr_details_content.append({
         "type": "paragraph",
@@ -616,162 +876,151 @@ def create_jira_document(mr_url: str, mr_data: Dict, processed_description: Opti
     }
 
 
-def convert_markdown_to_jira(markdown_text: str) -> List[Dict]:
-    """Convert markdown text to Jira document format."""
-    if not markdown_text or markdown_text.strip() == "No description provided":
-        return []
+def parse_inline_formatting(text: str) -> List[Dict]:
+    """Parse inline formatting like bold, italic, links, and code."""
+    # Fast path: plain text cannot contain any inline element
+    if '*' not in text and '`' not in text and '[' not in text:
+        return [{"type": "text", "text": text}]
 
-    lines = markdown_text.split('\n')
-    content = []
-    current_list_items = []
-
-    def flush_list():
-        """Flush any pending list items."""
-        nonlocal current_list_items
-        if current_list_items:
-            content.append({
-                "type": "bulletList",
-                "content": [
+    result = []
+    last = 0
+
+    for match in _RE_INLINE.finditer(text):
+        # Add text before the match
+        if match.start() > last:
+            result.append({
+                "type": "text",
+                "text": text[last:match.start()]
+            })
+
+        # Add the formatted text; inner groups directly follow the named group
+        mark_type = match.lastgroup
+        inner = match.lastindex + 1
+        if mark_type == 'link':
+            # Special handling for links
+            result.append({
+                "type": "text",
+                "text": match.group(inner),
+                "marks": [
                     {
-                        "type": "listItem",
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": item_content
-                            }
-                        ]
+                        "type": "link",
+                        "attrs": {
+                            "href": match.group(inner + 1)
+                        }
                     }
-                    for item_content in current_list_items
                 ]
             })
-            current_list_items = []
-
-    def parse_inline_formatting(text: str) -> List[Dict]:
-        """Parse inline formatting like bold, italic, links, and code."""
-        result = []
-        pos = 0
-
-        while pos < len(text):
-            # Find the next markdown element
-            patterns = [
-                (r'\*\*(.*?)\*\*', 'strong'),     # **bold**
-                (r'\*(.*?)\*', 'em'),             # *italic*
-                (r'`(.*?)`', 'code'),             # `code`
-                (r'\[(.*?)\]\((.*?)\)', 'link'),  # [text](url)
-            ]
-
-            earliest_match = None
-            earliest_pos = len(text)
-
-            for pattern, mark_type in patterns:
-                match = re.search(pattern, text[pos:])
-                if match and match.start() + pos < earliest_pos:
-                    earliest_pos = match.start() + pos
-                    earliest_match = (match, mark_type, pos)
-
-            if earliest_match:
-                match, mark_type, offset = earliest_match
-                actual_pos = earliest_pos
-
-                # Add text before the match
-                if actual_pos > pos:
-                    plain_text = text[pos:actual_pos]
-                    if plain_text:
-                        result.append({
-                            "type": "text",
-                            "text": plain_text
-                        })
-
-                # Add the formatted text
-                if mark_type == 'link':
-                    # Special handling for links
-                    link_text = match.group(1)
-                    link_url = match.group(2)
-                    result.append({
-                        "type": "text",
-                        "text": link_text,
-                        "marks": [
-                            {
-                                "type": "link",
-                                "attrs": {
-                                    "href": link_url
-                                }
-                            }
-                        ]
-                    })
-                else:
-                    # Regular formatting marks
-                    inner_text = match.group(1)
-                    result.append({
-                        "type": "text",
-                        "text": inner_text,
-                        "marks": [{"type": mark_type}]
-                    })
-
-                pos = actual_pos + len(match.group(0))
-            else:
-                # No more matches, add remaining text
-                remaining_text = text[pos:]
-                if remaining_text:
-                    result.append({
-                        "type": "text",
-                        "text": remaining_text
-                    })
-                break
+        else:
+            # Regular formatting marks
+            result.append({
+                "type": "text",
+                "text": match.group(inner),
+                "marks": _MARKS[mark_type]
+            })
+
+        last = match.end()
+
+    # Add remaining text after the last match
+    if last < len(text):
+        result.append({
+            "type": "text",
+            "text": text[last:]
+        })
+
+    return result if result else [{"type": "text", "text": text}]
+
+
+def _bullet_list(items: List[List[Dict]]) -> Dict:
+    """Build a bullet list node from the inline content of each item."""
+    return {
+        "type": "bulletList",
+        "content": [
+            {
+                "type": "listItem",
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": item_content
+                    }
+                ]
+            }
+            for item_content in items
+        ]
+    }
 
-        return result if result else [{"type": "text", "text": text}]
 
-    for line in lines:
+def _iter_markdown_blocks(markdown_text: str):
+    """Yield Jira block nodes for markdown text in a single pass over its lines.
+
+    Block types are recognised from the first characters of each line:
+    '#' to '######' plus whitespace starts a heading, and an optional indent
+    followed by '-', '*' or '+' plus whitespace starts a bullet list item.
+    """
+    list_items = []
+
+    for line in markdown_text.splitlines():
         line = line.rstrip()
 
-        # Empty line - flush any pending list and add paragraph break if needed
+        # Empty line - flush any pending list; don't add empty paragraphs
         if not line:
-            flush_list()
-            # Don't add empty paragraphs, just continue
+            if list_items:
+                yield _bullet_list(list_items)
+                list_items = []
             continue
 
         # Headings
-        heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-        if heading_match:
-            flush_list()
-            level = len(heading_match.group(1))
-            heading_text = heading_match.group(2)
-            content.append({
-                "type": "heading",
-                "attrs": {"level": min(level, 6)},  # Jira supports levels 1-6
-                "content": parse_inline_formatting(heading_text)
-            })
-            continue
+        if line[0] == '#':
+            level = len(line) - len(line.lstrip('#'))
+            # Jira supports levels 1-6; the line is rstripped, so text follows the whitespace
+            if level <= 6 and level < len(line) and line[level].isspace():
+                if list_items:
+                    yield _bullet_list(list_items)
+                    list_items = []
+                yield {
+                    "type": "heading",
+                    "attrs": {"level": level},
+                    "content": parse_inline_formatting(line[level:].lstrip())
+                }
+                continue
 
         # Lists (bullet points)
-        list_match = re.match(r'^[\s]*[-*+]\s+(.+)$', line)
-        if list_match:
-            item_text = list_match.group(1)
-            current_list_items.append(parse_inline_formatting(item_text))
+        item = line.lstrip() if line[0].isspace() else line
+        if item[0] in '-*+' and len(item) > 1 and item[1].isspace():
+            list_items.append(parse_inline_formatting(item[1:].lstrip()))
             continue
 
         # Regular paragraph
-        flush_list()
-        if line.strip():
-            content.append({
-                "type": "paragraph",
-                "content": parse_inline_formatting(line)
-            })
+        if list_items:
+            yield _bullet_list(list_items)
+            list_items = []
+        yield {
+            "type": "paragraph",
+            "content": parse_inline_formatting(line)
+        }
 
     # Flush any remaining list items
-    flush_list()
+    if list_items:
+        yield _bullet_list(list_items)
 
-    return content
 
+def convert_markdown_to_jira(markdown_text: str) -> List[Dict]:
+    """Convert markdown text to Jira document format."""
+    if not markdown_text or markdown_text.strip() == "No description provided":
+        return []
 
-def process_gitlab_description(description: str, gitlab_url: str, numeric_project_id: int, image_handling: str) -> str:
+    return list(_iter_markdown_blocks(markdown_text))
+
+
+def process_gitlab_description(description: str, gitlab_url: str, numeric_project_id: Optional[int], image_handling: str) -> str:
     """Process GitLab description to handle images and formatting for Jira."""
     if not description:
         return description
 
+    # Every image reference contains this literal; skip the regex when it is absent
+    if '](/uploads/' not in description:
+        return description
+
     # Convert relative image URLs to absolute GitLab URLs
-    # Pattern: ![alt text](/uploads/hash/filename.ext){optional attributes}
-    image_pattern = r'!\[([^\]]*)\]\((/uploads/[^)]+)\)(\{[^}]*\})?'
 
     def replace_image(match):
         alt_text = match.group(1) or "image"
@@ -779,13 +1028,14 @@ def process_gitlab_description(description: str, gitlab_url: str, numeric_projec
         # Note: attributes (match.group(3)) like {width=60%} are captured but not used
         # since they don't translate well to Jira format
 
+        if image_handling == "strip":
+            return f"[Image: {alt_text} - see original MR]"
+
         # Convert to absolute URL using GitLab's project ID format for images
         # GitLab stores images under: https://gitlab.com/-/project/{numeric_project_id}/uploads/{hash}/{filename}
         absolute_url = f"{gitlab_url.rstrip('/')}/-/project/{numeric_project_id}{relative_path}"
 
-        if image_handling == "strip":
-            return f"[Image: {alt_text} - see original MR]"
-        elif image_handling == "jira-syntax":
+        if image_handling == "jira-syntax":
             # Jira's image syntax (may not work for external URLs depending on Jira config)
             return f"!{absolute_url}!"
         else:  # "links"
@@ -793,7 +1043,7 @@ def process_gitlab_description(description: str, gitlab_url: str, numeric_projec
             return f"🖼️ **{alt_text}**: {absolute_url}"
 
     # Replace images
-    processed_description = re.sub(image_pattern, replace_image, description)
+    processed_description = _RE_IMAGE.sub(replace_image, description)
 
     return processed_description
 
@@ -816,8 +1066,11 @@ def interactive_component_selection(jira: 'JiraAPI', project_key: str, default_c
     print(Colors.bold("Available components:"))
 
     # Display available components in a compact format
-    for i, component in enumerate(components_data, 1):
-        print(f"  {Colors.command(f'{i:2d}.')} {component['name']}")
+    command, reset = Colors.COMMAND, Colors.RESET
+    sys.stdout.write(''.join(
+        f"  {command}{i:2d}.{reset} {component['name']}\n"
+        for i, component in enumerate(components_data, 1)
+    ))
 
     # Show current defaults
     if default_components:
@@ -828,6 +1081,7 @@ def interactive_component_selection(jira: 'JiraAPI', project_key: str, default_c
     print(f"\n{Colors.info(selection_msg)}")
     print(Colors.info('Press Enter with no input to use defaults, or "none" for no components'))
 
+    component_count = len(components_data)
     while True:
         try:
             selection = input("Your selection: ").strip()
@@ -841,24 +1095,26 @@ def interactive_component_selection(jira: 'JiraAPI', project_key: str, default_c
                 selected_components = []
                 break
             else:
-                # Parse selection
-                indices = [int(x.strip()) for x in selection.split()]
+                # Parse and range-check the selection in one pass
                 selected_components = []
-
-                for index in indices:
-                    if 1 <= index <= len(components_data):
-                        component_name = components_data[index - 1]['name']
-                        selected_components.append(component_name)
-                    else:
-                        invalid_msg = f"Invalid selection: {index}. Please select numbers between 1 and {len(components_data)}"
+                for token in selection.split():
+                    index = int(token)
+                    if not 1 <= index <= component_count:
+                        invalid_msg = f"Invalid selection: {index}. Please select numbers between 1 and {component_count}"
                         print(Colors.error(invalid_msg))
                         raise ValueError("Invalid selection")
+                    selected_components.append(components_data[index - 1]['name'])
 
                 break
 
         except (ValueError, IndexError):
             print(Colors.error("Invalid input. Please enter numbers separated by spaces, 'none', or press Enter for defaults."))
             continue
+        except EOFError:
+            # No terminal to answer from (e.g. stdin is /dev/null); go with the defaults
+            print(f"\n{Colors.warning('No selection given, using defaults')}")
+            selected_components = default_components or []
+            break
 
     if selected_components:
         components_str = ', '.join(selected_components)
@@ -869,99 +1125,134 @@ def interactive_component_selection(jira: 'JiraAPI', project_key: str, default_c
     return selected_components
 
 
-def validate_components(jira: 'JiraAPI', project_key: str, provided_components: List[str]) -> Optional[List[str]]:
-    """Validate provided component names against actual Jira project components."""
+# Options offered when provided components are not in the project: choice -> (label, action)
+_INVALID_COMPONENT_OPTIONS = {
+    "1": ("Continue with only valid components", "valid"),
+    "2": ("Use interactive component selection instead", "interactive"),
+    "3": ("Skip this merge request and fix component names", "skip"),
+}
+
+
+def validate_components(jira: 'JiraAPI', project_key: str, provided_components: List[str]) -> Tuple[str, List[str]]:
+    """Validate provided component names against actual Jira project components.
+
+    Returns an action and the components to use. The action is "valid" to
+    go ahead with the components, "interactive" to select them interactively
+    instead, or "skip" to give up on this merge request.
+    """
     if not provided_components:
-        return []
+        return "valid", []
 
     print(Colors.info(f"Validating components for project {project_key}..."))
 
-    # Get available components
-    components_data = jira.get_project_components(project_key)
-    if not components_data:
+    # Get available components, keyed case-insensitively
+    available_components = jira.get_component_names(project_key)
+    if not available_components:
         print(Colors.error("Could not fetch project components for validation."))
-        return provided_components  # Return as-is if we can't validate
-
-    # Create a mapping of component names (case-insensitive) to actual names
-    available_components = {comp['name'].lower(): comp['name'] for comp in components_data}
+        return "valid", provided_components  # Return as-is if we can't validate
 
     validated_components = []
     invalid_components = []
 
     for component in provided_components:
-        component_lower = component.lower()
-        if component_lower in available_components:
+        canonical_name = available_components.get(component.casefold())
+        if canonical_name is not None:
             # Use the correct case from Jira
-            validated_components.append(available_components[component_lower])
+            validated_components.append(canonical_name)
         else:
             invalid_components.append(component)
 
+    if invalid_components:
+        # Offer the closest real name for each typo before falling back to the menu.
+        # Imported here since it is only needed when a name is wrong.
+        from difflib import get_close_matches
+
+        unresolved = []
+        for component in invalid_components:
+            matches = get_close_matches(component.casefold(), available_components.keys(), n=1)
+            if matches:
+                suggestion = available_components[matches[0]]
+                try:
+                    answer = input(f"{Colors.INFO}Did you mean '{suggestion}' for '{component}'? [y/N]: {Style.RESET_ALL}")
+                except EOFError:
+                    # No terminal to answer from (e.g. stdin is /dev/null); treat as "no"
+                    answer = ''
+                if answer.strip().lower() in ['y', 'yes']:
+                    if suggestion not in validated_components:
+                        validated_components.append(suggestion)
+                    continue
+            unresolved.append(component)
+        invalid_components = unresolved
+
+    # Both outcomes below report the valid names
+    valid_str = ', '.join(validated_components)
+
     if invalid_components:
         invalid_str = ', '.join(invalid_components)
         print(Colors.error(f"Invalid components found: {invalid_str}"))
         print(Colors.bold("Available components:"))
-        for comp in components_data:
-            print(f"  - {comp['name']}")
+        sys.stdout.write(''.join(f"  - {comp['name']}\n" for comp in jira.get_project_components(project_key)))
 
         # Ask user what to do
-        print(f"\n{Colors.header('Choose an option:')}")
-        print(f"{Colors.command('1.')} Continue with only valid components")
-        print(f"{Colors.command('2.')} Use interactive component selection instead")
-        print(f"{Colors.command('3.')} Exit and fix component names")
+        sys.stdout.write(f"\n{Colors.header('Choose an option:')}\n" + ''.join(
+            f"{Colors.command(f'{key}.')} {label}\n" for key, (label, _) in _INVALID_COMPONENT_OPTIONS.items()
+        ))
 
         while True:
-            choice = input(f"{Colors.INFO}Your choice (1-3): {Style.RESET_ALL}").strip()
-            if choice == "1":
-                valid_str = ', '.join(validated_components)
+            try:
+                choice = input(f"{Colors.INFO}Your choice (1-3): {Style.RESET_ALL}").strip()
+            except EOFError:
+                # Nobody can answer; don't guess which components were meant
+                print(f"\n{Colors.warning('No answer given')}")
+                choice = "3"
+            option = _INVALID_COMPONENT_OPTIONS.get(choice)
+            if option is None:
+                print(Colors.error("Invalid choice. Please enter 1, 2, or 3."))
+                continue
+
+            action = option[1]
+            if action == "valid":
                 print(Colors.info(f"Continuing with valid components: {valid_str}"))
-                return validated_components
-            elif choice == "2":
+                return action, validated_components
+            if action == "interactive":
                 print(Colors.info("Switching to interactive component selection..."))
-                return None  # Signal to use interactive selection
-            elif choice == "3":
-                print(Colors.info("Exiting. Please fix component names and try again."))
-                sys.exit(1)
             else:
-                print(Colors.error("Invalid choice. Please enter 1, 2, or 3."))
+                print(Colors.info("Skipping this merge request. Please fix component names and try again."))
+            return action, []
 
     if validated_components:
-        valid_str = ', '.join(validated_components)
         print(Colors.success(f"All components validated: {valid_str}"))
 
-    return validated_components
+    return "valid", validated_components
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_path(path: str) -> str:
+    """URL-encode a project path (including slashes) for use as a GitLab project ID."""
+    return quote(path, safe='')
 
 
 def parse_mr_url(mr_url: str) -> Optional[tuple]:
     """Parse GitLab MR URL to extract project ID and MR IID."""
     # Expected format: https://gitlab.com/namespace/project/-/merge_requests/123
-    try:
-        parts = mr_url.rstrip('/').split('/')
-        mr_iid = parts[-1]
-
-        # Find the project path (everything between domain and /-/merge_requests)
-        mr_index = None
-        for i, part in enumerate(parts):
-            if part == '-' and i + 1 < len(parts) and parts[i + 1] == 'merge_requests':
-                mr_index = i
-                break
-
-        if mr_index is None:
-            return None
+    match = _RE_MR_URL.match(mr_url)
+    if not match:
+        return None
 
-        # Get project path and encode it
-        project_path = '/'.join(parts[3:mr_index])  # Skip https, empty, domain
-        from urllib.parse import quote
-        project_id = quote(project_path, safe='')
+    # Get project path (everything between domain and /-/merge_requests) and encode it
+    project_path, mr_iid = match['path'], match['iid']
+    project_id = _quote_path(project_path)
 
-        return project_id, mr_iid, project_path
-    except (IndexError, ValueError):
-        return None
+    return project_id, mr_iid, project_path
 
 
 def main():
     parser = argparse.ArgumentParser(description="Create Jira tickets from GitLab merge requests")
-    parser.add_argument("mr_url", nargs='?', help="GitLab merge request URL")
+    parser.add_argument("mr_urls", nargs='*', metavar="mr_url",
+                        help="GitLab merge request URL (several URLs are processed in one run)")
     parser.add_argument("--setup", action="store_true", help="Setup configuration interactively")
+    parser.add_argument("--config-from-env", action="store_true",
+                        help="Save configuration from environment variables without prompting")
     parser.add_argument("--project", help="Jira project key (overrides config)")
     parser.add_argument("--issue-type", help="Jira issue type (default: from config or Task)")
     parser.add_argument("--labels", nargs="*", help="Jira labels to add")
@@ -984,59 +1275,108 @@ def main():
         config.setup_interactive()
         return
 
+    if args.config_from_env:
+        if not config.setup_from_env():
+            sys.exit(1)
+        return
+
     # Validate we have an MR URL
-    if not args.mr_url:
+    if not args.mr_urls:
         print(Colors.error("Please provide a GitLab merge request URL"))
         parser.print_help()
         sys.exit(1)
 
+    # Reject malformed URLs before touching the configuration or the network,
+    # so a typo does not leave a batch half processed
+    parsed_urls = [(mr_url, parse_mr_url(mr_url)) for mr_url in args.mr_urls]
+    invalid_urls = [mr_url for mr_url, parsed in parsed_urls if not parsed]
+    if invalid_urls:
+        for mr_url in invalid_urls:
+            print(Colors.error(f"Invalid GitLab merge request URL format: {mr_url}"))
+        sys.exit(1)
+
     # Validate configuration
-    required_config = ['gitlab.url', 'gitlab.token', 'jira.url', 'jira.username', 'jira.api_token']
-    for key in required_config:
-        section, field = key.split('.')
-        if section not in config.config or field not in config.config[section]:
-            print(Colors.error(f"Missing configuration for {key}"))
+    for section, field in _REQUIRED_CONFIG:
+        section_config = config.config.get(section)
+        if not section_config or field not in section_config:
+            print(Colors.error(f"Missing configuration for {section}.{field}"))
             print(Colors.info("Run with --setup to configure, or set environment variables"))
             sys.exit(1)
 
-    # Parse MR URL
-    parsed = parse_mr_url(args.mr_url)
-    if not parsed:
-        print(Colors.error("Invalid GitLab merge request URL format"))
-        sys.exit(1)
-
-    project_id, mr_iid, project_path = parsed
-
     # Initialize API clients
-    gitlab = GitLabAPI(config.config['gitlab']['url'], config.config['gitlab']['token'])
-    jira = JiraAPI(config.config['jira']['url'],
-                   config.config['jira']['username'],
-                   config.config['jira']['api_token'])
-
-    # Get MR details
-    print(Colors.info(f"Fetching merge request details for {project_path}..."))
-    mr_data = gitlab.get_merge_request(project_id, mr_iid)
-    if not mr_data:
-        print(Colors.error("Could not fetch merge request details"))
+    gitlab_config = config.config['gitlab']
+    jira_config = config.config['jira']
+    etag_cache = load_etag_cache()
+    gitlab = GitLabAPI(gitlab_config['url'], gitlab_config['token'], etag_cache)
+    jira = JiraAPI(jira_config['url'], jira_config['username'], jira_config['api_token'], etag_cache)
+
+    # Process every MR with the same clients so connections are reused
+    failed_urls = []
+    for index, (mr_url, parsed) in enumerate(parsed_urls, 1):
+        if len(args.mr_urls) > 1:
+            print(Colors.section_divider(f"Merge request {index}/{len(args.mr_urls)}: {mr_url}"))
+        if not create_ticket_from_mr(args, config, gitlab, jira, mr_url, parsed):
+            failed_urls.append(mr_url)
+    save_etag_cache(etag_cache)
+
+    if failed_urls:
+        if len(args.mr_urls) > 1:
+            print(Colors.error(f"Failed to create tickets for {len(failed_urls)} of {len(args.mr_urls)} merge requests:"))
+            for mr_url in failed_urls:
+                print(f"  - {mr_url}")
         sys.exit(1)
 
-    # Get project details to get the numeric project ID needed for image URLs
-    print(Colors.info("Fetching project details..."))
-    project_data = gitlab.get_project_details(project_id)
-    if not project_data:
-        print(Colors.error("Could not fetch project details"))
-        sys.exit(1)
 
-    numeric_project_id = project_data['id']
+def create_ticket_from_mr(args: argparse.Namespace, config: Config, gitlab: GitLabAPI, jira: JiraAPI,
+                          mr_url: str, parsed: tuple) -> bool:
+    """Create a Jira ticket for a single GitLab merge request.
+
+    parsed is the result of parse_mr_url(mr_url), already checked by main().
+    Returns False if the ticket could not be created, True otherwise
+    (including when the user declines the preview).
+    """
+    project_id, mr_iid, project_path = parsed
+    jira_config = config.config['jira']
 
     # Determine Jira project (command line arg > project mapping > default config)
     project_key = (args.project or
                    config.get_jira_project_for_gitlab_project(project_path) or
-                   config.config.get('jira', {}).get('project_key'))
+                   jira_config.get('project_key'))
 
     if not project_key:
         print(Colors.error("No Jira project key found. Use --project, configure project mappings, or set default"))
-        sys.exit(1)
+        return False
+
+    # The MR and the Jira components are independent, so fetch them concurrently.
+    # Components land in the JiraAPI cache and are picked up by the component
+    # selection below.
+    # Imported here since --help and --setup never need a thread pool
+    from concurrent.futures import ThreadPoolExecutor
+
+    print(Colors.info(f"Fetching merge request details for {project_path}..."))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mr_future = executor.submit(gitlab.get_merge_request, project_id, mr_iid)
+        executor.submit(jira.get_project_components, project_key)
+        mr_data = mr_future.result()
+
+    if not mr_data:
+        print(Colors.error("Could not fetch merge request details"))
+        return False
+
+    # The numeric project ID is only needed to build image URLs. It is part of
+    # the MR payload; only ask for the project details if it is missing and
+    # the description has images that are not being stripped.
+    numeric_project_id = mr_data.get('project_id')
+    needs_project_id = (args.image_handling != 'strip'
+                        and '](/uploads/' in (mr_data.get('description') or ''))
+    if numeric_project_id is None and needs_project_id:
+        print(Colors.info("Fetching project details..."))
+        project_data = gitlab.get_project_details(project_id)
+        if not project_data:
+            print(Colors.error("Could not fetch project details"))
+            return False
+
+        numeric_project_id = project_data['id']
 
     # Get default settings from config
     defaults = config.get_default_settings()
@@ -1048,74 +1388,85 @@ def main():
     # Determine assignee based on auto_assign_me setting
     assignee = None
     if defaults.get('auto_assign_me', False):
-        assignee = config.config.get('jira', {}).get('username')
+        assignee = jira_config.get('username')
 
-    # Combine labels: defaults + command line args + auto-generated
-    labels = defaults.get('labels', []).copy()
+    # Combine labels: defaults + command line args + auto-generated.
+    # The defaults are shared by every MR in a run, so they are never mutated
+    # in place; a new list is only built when there is something to add.
+    labels = defaults.get('labels') or []
     if args.labels:
-        labels.extend(args.labels)
+        labels = [*labels, *args.labels]
     # labels.extend(['gitlab-mr', f"project-{mr_data['source_project_id']}"])
 
     # Handle components: validate provided components or use interactive selection
-    components = defaults.get('components', []).copy()
+    default_components = defaults.get('components', [])
 
     if args.components:
         # Validate provided components
-        validated_components = validate_components(jira, project_key, args.components)
-        if validated_components is None:
+        action, validated_components = validate_components(jira, project_key, args.components)
+        if action == "skip":
+            return False
+        if action == "interactive":
             # User chose to use interactive selection instead
-            components = interactive_component_selection(jira, project_key, components)
+            components = interactive_component_selection(jira, project_key, default_components)
         else:
             # Add validated components to defaults
-            components.extend(validated_components)
+            components = [*default_components, *validated_components]
     else:
         # No components provided via CLI, use interactive selection
-        components = interactive_component_selection(jira, project_key, components)
+        components = interactive_component_selection(jira, project_key, default_components)
 
     summary = mr_data['title']
 
     if not summary:
         print(Colors.error("Merge request has no title. Cannot create Jira ticket."))
-        sys.exit(1)
+        return False
 
     # Process the description to handle images and relative links
     processed_description = process_gitlab_description(
         mr_data.get('description', ''),
-        config.config['gitlab']['url'],
+        gitlab.url,
         numeric_project_id,
         args.image_handling
     )
 
     # Create structured Jira document
-    description_content = create_jira_document(args.mr_url, mr_data, processed_description)
+    description_content = create_jira_document(mr_url, mr_data, processed_description)
 
     # Always show preview unless --yes or --no-preview is used
     skip_preview = args.yes or args.no_preview
 
     if not skip_preview:
-        print(Colors.section_divider("PREVIEW: Jira ticket to be created"))
-        print(f"{Colors.bold('Project:')} {Colors.command(project_key)}")
-        print(f"{Colors.bold('Issue Type:')} {Colors.command(issue_type)}")
-        print(f"{Colors.bold('Summary:')} {summary}")
-        print(f"{Colors.bold('Description Preview:')} {processed_description[:200]}{'...' if len(processed_description) > 200 else ''}")
-        print(f"{Colors.bold('Labels:')} {Colors.command(str(labels))}")
+        # Render the whole preview with a single write
+        bold, command, info = Colors.bold, Colors.command, Colors.info
+        preview = [Colors.section_divider("PREVIEW: Jira ticket to be created")]
+        preview.append(f"{bold('Project:')} {command(project_key)}")
+        preview.append(f"{bold('Issue Type:')} {command(issue_type)}")
+        preview.append(f"{bold('Summary:')} {summary}")
+        # GitLab sends null for an empty description; only slice when it is too long
+        description_preview = processed_description or ''
+        if len(description_preview) > 200:
+            description_preview = f"{description_preview[:200]}..."
+        preview.append(f"{bold('Description Preview:')} {description_preview}")
+        preview.append(f"{bold('Labels:')} {command(str(labels))}")
         if components:
             components_str = ', '.join(components)
-            print(f"{Colors.bold('Components:')} {Colors.command(components_str)}")
+            preview.append(f"{bold('Components:')} {command(components_str)}")
         if priority:
-            print(f"{Colors.bold('Priority:')} {Colors.command(priority)}")
+            preview.append(f"{bold('Priority:')} {command(priority)}")
         if assignee:
-            print(f"{Colors.bold('Assignee:')} {Colors.command(assignee)}")
-        print(f"{Colors.bold('GitLab Project:')} {Colors.command(project_path)}")
+            preview.append(f"{bold('Assignee:')} {command(assignee)}")
+        preview.append(f"{bold('GitLab Project:')} {command(project_path)}")
         if args.set_in_progress:
-            print(Colors.info("Will set ticket to 'In Progress' status"))
+            preview.append(info("Will set ticket to 'In Progress' status"))
         if args.update_mr_title:
-            print(Colors.info("Will update MR title to include Jira ticket key"))
+            preview.append(info("Will update MR title to include Jira ticket key"))
+        sys.stdout.write('\n'.join(preview) + '\n')
 
         # Ask for confirmation
         if not confirm_creation():
             print(Colors.warning("Ticket creation cancelled by user"))
-            return
+            return True
 
     # Create Jira ticket
     print(Colors.info(f"Creating Jira ticket in project {project_key}..."))
@@ -1132,34 +1483,44 @@ def main():
 
     if result:
         ticket_key = result['key']
-        ticket_url = f"{config.config['jira']['url']}/browse/{ticket_key}"
+        ticket_url = f"{jira.url}/browse/{ticket_key}"
         print(Colors.success(f"Successfully created Jira ticket: {ticket_key}"))
         print(Colors.url(ticket_url))
 
-        # Set ticket to In Progress if requested
-        if args.set_in_progress:
-            print(Colors.info(f"Setting ticket {ticket_key} to 'In Progress'..."))
-            if jira.transition_ticket(ticket_key, "In Progress"):
+        # The Jira transition and the MR title update are independent, so
+        # both requests are sent concurrently and reported once done
+        transition_future = title_future = None
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Set ticket to In Progress if requested
+            if args.set_in_progress:
+                print(Colors.info(f"Setting ticket {ticket_key} to 'In Progress'..."))
+                transition_future = executor.submit(jira.transition_ticket, ticket_key, "In Progress")
+
+            # Update MR title if requested
+            if args.update_mr_title:
+                original_title = mr_data['title']
+                # Check if title already has a Jira ticket key
+                if not _RE_TITLE_PREFIX.match(original_title):
+                    new_title = f"[{ticket_key}] {original_title}"
+                    print(Colors.info(f"Updating MR title to: {new_title}"))
+                    title_future = executor.submit(gitlab.update_merge_request_title, project_id, mr_iid, new_title)
+                else:
+                    print(Colors.warning("MR title already appears to have a ticket key, skipping update"))
+
+        if transition_future is not None:
+            if transition_future.result():
                 print(Colors.success(f"Successfully set {ticket_key} to 'In Progress'"))
             else:
                 print(Colors.error(f"Failed to set {ticket_key} to 'In Progress'"))
-
-        # Update MR title if requested
-        if args.update_mr_title:
-            original_title = mr_data['title']
-            # Check if title already has a Jira ticket key
-            if not original_title.startswith('[') or ']' not in original_title:
-                new_title = f"[{ticket_key}] {original_title}"
-                print(Colors.info(f"Updating MR title to: {new_title}"))
-                if gitlab.update_merge_request_title(project_id, mr_iid, new_title):
-                    print(Colors.success("Successfully updated MR title"))
-                else:
-                    print(Colors.error("Failed to update MR title"))
+        if title_future is not None:
+            if title_future.result():
+                print(Colors.success("Successfully updated MR title"))
             else:
-                print(Colors.warning("MR title already appears to have a ticket key, skipping update"))
+                print(Colors.error("Failed to update MR title"))
+        return True
     else:
         print(Colors.error("Failed to create Jira ticket"))
-        sys.exit(1)
+        return False
 
 
 if __name__ == "__main__":